@@ -1,3 +1,5 @@
+import threading
+
 from ._settings import Settings, clear_settings
 from ._version import version as __version__
 
@@ -5,15 +7,21 @@ __all__ = ["get_settings", "clear_settings", "__version__"]
 
 # Singleton instance
 _settings_instance = None
+# Only taken while the instance is first created
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
     """Get the singleton instance of the settings manager."""
     global _settings_instance
-    if _settings_instance is None:
-        from pathlib import Path
+    settings = _settings_instance
+    if settings is not None:
+        return settings
+    with _settings_lock:
+        if _settings_instance is None:
+            from pathlib import Path
 
-        _settings_instance = Settings(
-            str(Path(__file__).parent / "ndev_settings.yaml")
-        )
-    return _settings_instance
+            _settings_instance = Settings(
+                Path(__file__).parent / "ndev_settings.yaml"
+            )
+        return _settings_instance
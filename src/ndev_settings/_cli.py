@@ -2,11 +2,14 @@
 
 import sys
 from pathlib import Path
+from typing import IO
 
 import yaml
 
+from ndev_settings._settings import _Dumper, _Loader
 
-def reset_values_to_defaults(settings_file: Path | str) -> bool:
+
+def reset_values_to_defaults(settings_file: Path | str | IO) -> bool:
     """Reset all 'value' fields to match 'default' fields in a settings YAML file.
 
     Works with flat format settings files where groups are at the top level.
@@ -14,56 +17,163 @@ def reset_values_to_defaults(settings_file: Path | str) -> bool:
 
     Parameters
     ----------
-    settings_file : Path | str
-        Path to the settings YAML file to reset
+    settings_file : Path | str | IO
+        Path to the settings YAML file to reset, or a seekable file-like
+        object (text or binary) that is rewritten in place
 
     Returns
     -------
     bool
         True if file was modified, False otherwise
     """
-    settings_file = Path(settings_file)
+    stream = settings_file if hasattr(settings_file, "read") else None
+
+    if stream is not None:
+        content = stream.read()
+    else:
+        settings_file = Path(settings_file)
+
+        if not settings_file.exists():
+            print(f"Settings file not found: {settings_file}")
+            return False
+
+        content = settings_file.read_bytes()
 
-    if not settings_file.exists():
-        print(f"Settings file not found: {settings_file}")
+    # Nothing can be reset without a 'default' key, so skip the YAML parse
+    if (
+        b"default" if isinstance(content, bytes) else "default"
+    ) not in content:
         return False
 
-    with open(settings_file) as f:
-        settings_data = yaml.load(f, Loader=yaml.FullLoader)
+    # Compose once: the node tree keeps source positions for the in-place
+    # edit below, and the data constructed from it drives the reset
+    text = content.decode() if isinstance(content, bytes) else content
+    loader = _Loader(text)
+    try:
+        root = loader.get_single_node()
+        settings_data = (
+            loader.construct_document(root) if root is not None else None
+        )
+    finally:
+        loader.dispose()
 
     if not settings_data:
         return False
 
-    modified = False
+    # Flatten once to (group, setting, node) leaves that can be reset,
+    # skipping metadata keys (e.g., _entry_points_hash) and non-dict groups
+    leaves = [
+        (group_name, setting_name, setting_data)
+        for group_name, group_settings in settings_data.items()
+        if not group_name.startswith("_") and isinstance(group_settings, dict)
+        for setting_name, setting_data in group_settings.items()
+        if isinstance(setting_data, dict)
+        and "default" in setting_data
+        and "value" in setting_data
+    ]
+
+    changed = []
+    for group_name, setting_name, setting_data in leaves:
+        value, default = setting_data["value"], setting_data["default"]
+        if value != default:
+            print(
+                f"Resetting {group_name}.{setting_name}: {value} -> {default}"
+            )
+            setting_data["value"] = default
+            changed.append((group_name, setting_name))
 
-    for group_name, group_settings in settings_data.items():
-        # Skip metadata keys (e.g., _entry_points_hash)
-        if group_name.startswith("_"):
-            continue
-        if not isinstance(group_settings, dict):
-            continue
+    if not changed:
+        return False
 
-        for setting_name, setting_data in group_settings.items():
+    # Edit the changed values in place to keep comments and formatting,
+    # falling back to re-dumping the whole document if that's not possible
+    new_text = _splice_defaults(text, root, changed)
+    if new_text is not None:
+        try:
+            if yaml.load(new_text, Loader=_Loader) != settings_data:
+                new_text = None
+        except yaml.YAMLError:
+            new_text = None
+    if new_text is None:
+        new_text = yaml.dump(
+            settings_data,
+            Dumper=_Dumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    if stream is not None:
+        # Match what was read, and encode before truncating the caller's data
+        new_content = (
+            new_text if isinstance(content, str) else new_text.encode()
+        )
+        stream.seek(0)
+        stream.truncate()
+        stream.write(new_content)
+    else:
+        settings_file.write_bytes(new_text.encode())
+
+    return True
+
+
+def _mapping_get(node: yaml.Node | None, key: str) -> yaml.Node | None:
+    """Return the value node for `key` in a composed YAML mapping node."""
+    if not isinstance(node, yaml.MappingNode):
+        return None
+    for key_node, value_node in node.value:
+        if isinstance(key_node, yaml.ScalarNode) and key_node.value == key:
+            return value_node
+    return None
+
+
+def _splice_defaults(
+    text: str, root: yaml.Node, changed: list[tuple[str, str]]
+) -> str | None:
+    """Copy the source text of each changed 'default' over its 'value'.
+
+    `root` is the node tree composed from `text`. Only single-line scalars
+    written on the same line as their key, without anchors or aliases,
+    are edited; returns None when any changed setting doesn't fit that
+    shape.
+    """
+    edits = []
+    for group_name, setting_name in changed:
+        setting_node = _mapping_get(
+            _mapping_get(root, group_name), setting_name
+        )
+        if not isinstance(setting_node, yaml.MappingNode):
+            return None
+        nodes = {}
+        for key_node, value_node in setting_node.value:
+            if key_node.value in ("value", "default"):
+                nodes[key_node.value] = (key_node, value_node)
+        if len(nodes) != 2:
+            return None
+        for key_node, value_node in nodes.values():
             if (
-                isinstance(setting_data, dict)
-                and "default" in setting_data
-                and "value" in setting_data
-                and setting_data["value"] != setting_data["default"]
+                not isinstance(value_node, yaml.ScalarNode)
+                or value_node.style in ("|", ">")
+                or value_node.start_mark.index == value_node.end_mark.index
+                or value_node.start_mark.line != key_node.start_mark.line
+                or value_node.end_mark.line != key_node.start_mark.line
+                or text[value_node.start_mark.index] in "&*"
             ):
-                print(
-                    f"Resetting {group_name}.{setting_name}: "
-                    f"{setting_data['value']} -> {setting_data['default']}"
-                )
-                setting_data["value"] = setting_data["default"]
-                modified = True
-
-    if modified:
-        with open(settings_file, "w") as f:
-            yaml.dump(
-                settings_data, f, default_flow_style=False, sort_keys=False
+                return None
+        value_node = nodes["value"][1]
+        default_node = nodes["default"][1]
+        edits.append(
+            (
+                value_node.start_mark.index,
+                value_node.end_mark.index,
+                text[
+                    default_node.start_mark.index : default_node.end_mark.index
+                ],
             )
+        )
 
-    return modified
+    for start, end, replacement in sorted(edits, reverse=True):
+        text = text[:start] + replacement + text[end:]
+    return text
 
 
 def main_reset_values():
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
 import hashlib
+import json
 import logging
+import marshal
+import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
 from importlib.metadata import entry_points
 from pathlib import Path
 from urllib.parse import unquote, urlparse
@@ -16,38 +26,339 @@ logger = logging.getLogger(__name__)
 _SETTINGS_DIR = Path(appdirs.user_config_dir("ndev-settings", appauthor=False))
 _SETTINGS_FILE = _SETTINGS_DIR / "settings.yaml"
 
+# Entry point group that packages use to contribute settings YAML files
+_ENTRY_POINT_GROUP = "ndev_settings.manifest"
+
+# Prefer the libyaml-backed C loader/dumper when available (much faster).
+# Full (not safe) variants are required for !!python/tuple values.
+_Loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+class _SettingsDumper(_Dumper):
+    """Dumper that writes shared objects out in full instead of as aliases.
+
+    Keeps each group's YAML self-contained, so groups can be dumped
+    separately and concatenated (duplicate anchors would not load).
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+# Parsed YAML keyed by (path, mtime_ns, size), bounded LRU
+_PARSE_CACHE_MAXSIZE = 128
+_PARSE_CACHE: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+# Guards _PARSE_CACHE bookkeeping; parsing itself runs outside the lock
+_PARSE_CACHE_LOCK = threading.Lock()
+
 
 def _load_yaml(path: Path) -> dict:
     """Load a YAML file, returning empty dict if missing or invalid.
 
-    Uses FullLoader to support Python-specific types like tuples
+    Uses a FullLoader to support Python-specific types like tuples
     (e.g., canvas_size: !!python/tuple [1024, 1024]) in settings files.
+
+    Parsed results are cached by (path, mtime, size), so unchanged files
+    are only parsed once per session. Callers receive their own copy.
     """
     try:
-        with open(path) as f:
-            return yaml.load(f, Loader=yaml.FullLoader) or {}
-    except (FileNotFoundError, yaml.YAMLError, OSError):
+        st = os.stat(path)
+    except OSError:
         return {}
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+    if cached is None:
+        try:
+            with open(path, "rb") as f:
+                cached = yaml.load(f.read(), Loader=_Loader) or {}
+        except (FileNotFoundError, yaml.YAMLError, OSError):
+            return {}
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = cached
+            if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return _copy_tree(cached)
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _copy_tree(obj):
+    """Copy the mutable containers of a parsed YAML tree.
+
+    Much cheaper than `copy.deepcopy`: dicts and lists are rebuilt, while
+    immutable leaves (str, int, float, bool, None, tuples of those) are
+    shared with the cached original instead of being copied.
+    """
+    # Exact-type check first: scalars are by far the most common leaves
+    if type(obj) in _SCALAR_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_tree(item) for item in obj]
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    if isinstance(obj, tuple):
+        return tuple(_copy_tree(item) for item in obj)
+    return copy.deepcopy(obj)
+
+
+def _is_immutable(obj) -> bool:
+    """Whether a parsed YAML value can't be changed in place."""
+    if isinstance(obj, tuple):
+        return all(_is_immutable(item) for item in obj)
+    return isinstance(obj, (str, int, float, bool, type(None)))
+
+
+def _dump_yaml(data: dict) -> bytes:
+    """Render settings data as block-style UTF-8 YAML, keeping key order."""
+    return yaml.dump(
+        data,
+        Dumper=_SettingsDumper,
+        encoding="utf-8",
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def _invalidate_parse_cache(path: Path) -> None:
+    """Drop all cached parses of `path` (e.g., after writing to it)."""
+    path_str = os.path.abspath(path)
+    with _PARSE_CACHE_LOCK:
+        for key in [k for k in _PARSE_CACHE if k[0] == path_str]:
+            del _PARSE_CACHE[key]
+
+
+def _sidecar_path() -> Path:
+    """Path of the marshal sidecar cache written next to the settings file."""
+    return _SETTINGS_FILE.with_suffix(".marshal")
+
+
+def _file_mode(path: Path) -> int:
+    """Permission bits for writing `path`, as plain `open()` would leave them.
+
+    mkstemp() creates files as 0600, so the existing mode is kept, or the
+    umask applied to 0666 for new files.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to a temporary file, then atomically replace `path`.
 
+    Readers never observe a partially written file, and the data is
+    flushed to disk before the rename so a crash can't leave it empty.
+    The temporary file is unique, so concurrent writers (e.g., two napari
+    sessions) can't replace `path` with each other's partial writes.
+    `path` keeps its permissions; a new file gets the usual umask-based ones.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _is_unchanged(yaml_bytes: bytes) -> bool:
+    """Whether the settings file and its sidecar already hold `yaml_bytes`."""
+    try:
+        return (
+            _sidecar_path().exists()
+            and _SETTINGS_FILE.read_bytes() == yaml_bytes
+        )
+    except OSError:
+        return False
+
+
+def _write_sidecar(yaml_bytes: bytes, data: dict) -> None:
+    """Write the marshal sidecar for the given settings YAML contents.
+
+    marshal round-trips plain containers (including tuples) natively and
+    is much faster to load than YAML. Data it can't represent (e.g.,
+    dates) gets no sidecar, so those settings are always read from YAML.
+    """
+    try:
+        sidecar = marshal.dumps((hashlib.sha256(yaml_bytes).digest(), data))
+    except ValueError:
+        _sidecar_path().unlink(missing_ok=True)
+        return
+    _atomic_write_bytes(_sidecar_path(), sidecar)
+
+
+def _load_settings_file() -> dict:
+    """Load the user settings file, preferring its marshal sidecar.
 
+    The sidecar is only used when its embedded hash matches the current
+    YAML contents, so external edits to the YAML are always respected.
+    """
+    try:
+        yaml_bytes = _SETTINGS_FILE.read_bytes()
+        digest, data = marshal.loads(_sidecar_path().read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        return _load_yaml(_SETTINGS_FILE)
+
+    if digest == hashlib.sha256(yaml_bytes).digest() and isinstance(
+        data, dict
+    ):
+        return data
+    return _load_yaml(_SETTINGS_FILE)
+
+
+@functools.lru_cache(maxsize=1)
 def _get_entry_points_hash() -> str:
     """Generate a hash of installed ndev_settings.manifest entry points.
 
-    Used to detect when packages are installed/removed.
+    Used to detect when packages are installed/removed. Memoized for the
+    session; `clear_settings()` resets it.
     """
-    eps = entry_points(group="ndev_settings.manifest")
+    eps = entry_points(group=_ENTRY_POINT_GROUP)
     ep_strings = sorted(f"{ep.name}:{ep.value}" for ep in eps)
     return hashlib.sha256("|".join(ep_strings).encode()).hexdigest()
 
 
+def _resolve_external_yaml_path(package_name: str, resource_name: str) -> Path:
+    """Find an external package's settings YAML without importing it.
+
+    Uses distribution() to find the package location, which avoids slow
+    package imports (e.g., ndevio takes 2.5s to import).
+    """
+    from importlib.metadata import distribution
+
+    dist = distribution(package_name)
+
+    # For regular installs, dist.files contains the file list. In the same
+    # pass, note direct_url.json (PEP 610) in case this is an editable install
+    direct_url_file = None
+    for file in dist.files or []:
+        if file.name == resource_name and package_name in str(file):
+            return Path(str(dist.locate_file(file)))
+        if direct_url_file is None and file.name == "direct_url.json":
+            direct_url_file = Path(str(dist.locate_file(file)))
+
+    direct_url = {}
+    if direct_url_file is not None:
+        # Read directly rather than exists() + open() (one fewer stat)
+        with contextlib.suppress(FileNotFoundError):
+            direct_url = json.loads(direct_url_file.read_bytes())
+
+    if direct_url.get("dir_info", {}).get("editable"):
+        # Editable install - use source path
+        # Use urllib.parse for proper file URL handling
+        url = direct_url["url"]
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            # Handle both Unix and Windows paths
+            path_str = unquote(parsed.path)
+            # On Windows, path may start with /C:/...
+            if len(path_str) > 2 and path_str[0] == "/" and path_str[2] == ":":
+                path_str = path_str[1:]  # Remove leading /
+            source_path = Path(path_str)
+        else:
+            source_path = Path(url)
+        return source_path / "src" / package_name / resource_name
+
+    # Final fallback: try site-packages path
+    package_location = str(dist.locate_file(package_name))
+    return Path(package_location) / resource_name
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_external_yaml_paths(
+    eps: tuple[tuple[str, str], ...],
+) -> tuple[Path, ...]:
+    """Resolve settings YAML paths for (name, value) entry point pairs.
+
+    Cached per set of entry points, so repeated Settings construction
+    skips the distribution metadata walk. Call `cache_clear()` if the
+    underlying installs may have changed without the entry points
+    changing (e.g., in tests). Broken entry points are logged and skipped.
+
+    Entry points naming the same resource (or resolving to the same
+    file) are only returned once: with first-wins merging, a repeated
+    file can never contribute anything new.
+    """
+    paths = []
+    seen_values = set()
+    for name, value in eps:
+        if value in seen_values:
+            continue
+        seen_values.add(value)
+        try:
+            package_name, resource_name = value.split(":", 1)
+            path = _resolve_external_yaml_path(package_name, resource_name)
+            if path not in paths:
+                paths.append(path)
+        except (
+            ModuleNotFoundError,
+            FileNotFoundError,
+            ValueError,
+            PermissionError,
+            OSError,
+        ) as e:
+            logger.warning("Failed to load settings from '%s': %s", name, e)
+    return tuple(paths)
+
+
+@functools.cache
+def _get_dynamic_choices(provider_key: str) -> tuple[str, ...]:
+    """Names of entry points in the `provider_key` group, cached per group.
+
+    Call `cache_clear()` to pick up packages installed mid-session.
+    """
+    return tuple(ep.name for ep in entry_points(group=provider_key))
+
+
 def clear_settings() -> None:
     """Clear saved settings. Next load will use fresh defaults."""
     if _SETTINGS_FILE.exists():
         _SETTINGS_FILE.unlink()
+    _sidecar_path().unlink(missing_ok=True)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+    _discover_external_yaml_paths.cache_clear()
+    _get_entry_points_hash.cache_clear()
+    _get_dynamic_choices.cache_clear()
+
+
+_MISSING = object()
 
 
 class SettingsGroup:
-    """Simple container for settings in a group."""
+    """Simple container for settings in a group.
+
+    Names of settings assigned a different object since the last save are
+    tracked in `_dirty`, so `Settings.save()` only syncs those. Identity
+    (not equality) is compared, so e.g. a replaced list or 49.0 over 49
+    is always written back; unchanged bytes are skipped at save time.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, "_dirty", set())
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get(name, _MISSING) is not value:
+            self._dirty.add(name)
+        object.__setattr__(self, name, value)
 
 
 class Settings:
@@ -61,17 +372,21 @@ class Settings:
     preserving existing user values.
     """
 
-    def __init__(self, defaults_file: str | None = None):
+    def __init__(self, defaults_file: str | os.PathLike | None = None):
         """Initialize settings.
 
         Parameters
         ----------
-        defaults_file : str, optional
+        defaults_file : str or os.PathLike, optional
             Path to a YAML file with default settings. Usually the main
             ndev_settings.yaml file. External contributions are merged in.
         """
-        self._defaults_path = Path(defaults_file) if defaults_file else None
+        self._defaults_path = (
+            Path(defaults_file) if defaults_file is not None else None
+        )
         self._grouped_settings: dict = {}
+        # Rendered YAML per group, reused by save() for unmodified groups
+        self._group_yaml: dict[str, bytes] = {}
         self._load()
 
     def _load(self):
@@ -90,10 +405,34 @@ class Settings:
             all_settings = self._load_defaults()
             self._save_settings(all_settings)
 
-        # Build group objects and store
-        self._build_groups(all_settings)
+        # Group objects are built lazily on first access (see __getattr__)
         self._grouped_settings = all_settings
 
+    def __getattr__(self, name: str):
+        """Build a group object from `_grouped_settings` on first access.
+
+        Only called when normal attribute lookup fails, so groups that were
+        already built are plain instance attributes.
+        """
+        group_settings = self.__dict__.get("_grouped_settings", {}).get(name)
+        if name.startswith("_") or not isinstance(group_settings, dict):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        group_obj = self._build_group(group_settings)
+        setattr(self, name, group_obj)
+        return group_obj
+
+    def __contains__(self, group_name: str) -> bool:
+        """Whether a settings group exists, without building its object.
+
+        Agrees with `__getattr__`: metadata keys and non-dict entries are
+        not groups.
+        """
+        return not group_name.startswith("_") and isinstance(
+            self._grouped_settings.get(group_name), dict
+        )
+
     def _load_defaults(self) -> dict:
         """Load default settings from main file and external contributions."""
         all_settings = {}
@@ -104,111 +443,39 @@ class Settings:
 
         # Load external YAML files from entry points
         # Sort for deterministic merge order across environments
-        eps = sorted(
-            entry_points(group="ndev_settings.manifest"),
-            key=lambda ep: (ep.name, ep.value),
+        eps = tuple(
+            sorted(
+                (ep.name, ep.value)
+                for ep in entry_points(group=_ENTRY_POINT_GROUP)
+            )
         )
-        for ep in eps:
-            try:
-                package_name, resource_name = ep.value.split(":", 1)
-
-                # Use distribution() to find package location WITHOUT importing it
-                # This avoids slow package imports (e.g., ndevio takes 2.5s to import)
-                from importlib.metadata import distribution
-
-                dist = distribution(package_name)
-                yaml_path = None
-
-                # For regular installs, dist.files contains the file list
-                for file in dist.files or []:
-                    if file.name == resource_name and package_name in str(
-                        file
-                    ):
-                        yaml_path = Path(str(dist.locate_file(file)))
-                        break
-
-                if yaml_path is None:
-                    # For editable installs, check direct_url.json (PEP 610)
-                    # Find direct_url.json from dist.files (includes dist-info path)
-                    direct_url_file = None
-                    for file in dist.files or []:
-                        if file.name == "direct_url.json":
-                            direct_url_file = Path(str(dist.locate_file(file)))
-                            break
-
-                    if (
-                        direct_url_file is not None
-                        and direct_url_file.exists()
-                    ):
-                        import json
-
-                        with open(direct_url_file) as f:
-                            direct_url = json.load(f)
-                        if direct_url.get("dir_info", {}).get("editable"):
-                            # Editable install - use source path
-                            # Use urllib.parse for proper file URL handling
-                            url = direct_url["url"]
-                            parsed = urlparse(url)
-                            if parsed.scheme == "file":
-                                # Handle both Unix and Windows paths
-                                path_str = unquote(parsed.path)
-                                # On Windows, path may start with /C:/...
-                                if (
-                                    len(path_str) > 2
-                                    and path_str[0] == "/"
-                                    and path_str[2] == ":"
-                                ):
-                                    path_str = path_str[1:]  # Remove leading /
-                                source_path = Path(path_str)
-                            else:
-                                source_path = Path(url)
-                            yaml_path = (
-                                source_path
-                                / "src"
-                                / package_name
-                                / resource_name
-                            )
-
-                if yaml_path is None:
-                    # Final fallback: try site-packages path
-                    package_location = str(dist.locate_file(package_name))
-                    yaml_path = Path(package_location) / resource_name
-
-                external = _load_yaml(yaml_path)
-
-                # Merge external settings (first one wins for conflicts)
-                for group_name, group_settings in external.items():
-                    if group_name not in all_settings:
-                        all_settings[group_name] = {}
-                    for name, data in group_settings.items():
-                        if name not in all_settings[group_name]:
-                            all_settings[group_name][name] = data
-            except (
-                ModuleNotFoundError,
-                FileNotFoundError,
-                ValueError,
-                PermissionError,
-                OSError,
-            ) as e:
-                logger.warning(
-                    "Failed to load settings from '%s': %s", ep.name, e
-                )
+        for yaml_path in _discover_external_yaml_paths(eps):
+            external = _load_yaml(yaml_path)
+
+            # Merge external settings (first one wins for conflicts)
+            for group_name, group_settings in external.items():
+                merged = all_settings.get(group_name)
+                if merged is None:
+                    # New group: `external` is our own copy, adopt it whole
+                    all_settings[group_name] = group_settings
+                    continue
+                for name, data in group_settings.items():
+                    if name not in merged:
+                        merged[name] = data
 
         return all_settings
 
     def _load_saved(self) -> dict | None:
         """Load saved settings if valid, return None if stale or missing."""
-        if not _SETTINGS_FILE.exists():
-            return None
-
-        saved = _load_yaml(_SETTINGS_FILE)
+        # A missing file loads as {} without a separate exists() check
+        saved = _load_settings_file()
         if not saved:
             return None
 
         # Check if packages changed - if so, need to re-discover
         # Pop the hash from saved - this is safe because:
         # - If hash doesn't match, we merge with defaults (saved used for values only)
-        # - If hash matches, we return saved (but _build_groups skips _ keys anyway)
+        # - If hash matches, we return saved (but __getattr__ skips _ keys anyway)
         saved_hash = saved.pop("_entry_points_hash", None)
         if saved_hash != _get_entry_points_hash():
             # Packages installed/removed - merge new defaults with saved values
@@ -236,60 +503,110 @@ class Settings:
                         merged[group_name][name]["value"] = saved_data["value"]
         return merged
 
-    def _save_settings(self, settings: dict) -> None:
-        """Save settings to file in flat format with hash at top."""
+    def _save_settings(
+        self, settings: dict, yaml_bytes: bytes | None = None
+    ) -> None:
+        """Save settings to file in flat format with hash at top.
+
+        `yaml_bytes` may be passed when the caller has already rendered
+        the file. Skips writing when the file on disk already has
+        identical contents.
+        """
         try:
-            _SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
             # Flat format: hash first, then all settings groups
             data = {"_entry_points_hash": _get_entry_points_hash(), **settings}
-            with open(_SETTINGS_FILE, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            if yaml_bytes is None:
+                yaml_bytes = _dump_yaml(data)
+            if _is_unchanged(yaml_bytes):
+                return
+            # Same-size rewrites may not change mtime on coarse filesystems
+            _invalidate_parse_cache(_SETTINGS_FILE)
+            _SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(_SETTINGS_FILE, yaml_bytes)
+            _write_sidecar(yaml_bytes, data)
         except (OSError, PermissionError) as e:
             logger.warning(
                 "Failed to save settings to %s: %s", _SETTINGS_FILE, e
             )
 
-    def _build_groups(self, settings: dict):
-        """Create SettingsGroup objects from settings dict."""
-        for group_name, group_settings in settings.items():
-            # Skip metadata keys (e.g., _entry_points_hash)
-            if group_name.startswith("_"):
-                continue
-            # Skip malformed entries that aren't dicts
-            if not isinstance(group_settings, dict):
-                continue
-            group_obj = SettingsGroup()
-            for name, setting_data in group_settings.items():
-                if isinstance(setting_data, dict) and "value" in setting_data:
-                    setattr(group_obj, name, setting_data["value"])
-            setattr(self, group_name, group_obj)
-
-    def _sync_groups_to_dict(self):
-        """Sync current group object values back to _grouped_settings dict."""
+    @staticmethod
+    def _build_group(group_settings: dict) -> SettingsGroup:
+        """Create a SettingsGroup holding the values of one group."""
+        group_obj = SettingsGroup()
+        # Fill the instance dict directly: these are loaded values, so
+        # they bypass the dirty tracking in SettingsGroup.__setattr__
+        vars(group_obj).update(
+            {
+                name: setting_data["value"]
+                for name, setting_data in group_settings.items()
+                if isinstance(setting_data, dict) and "value" in setting_data
+            }
+        )
+        return group_obj
+
+    def _sync_groups_to_dict(self) -> set[str]:
+        """Sync modified group object values back to _grouped_settings dict.
+
+        Returns the names of groups that had modifications.
+        """
+        dirty_groups = set()
         for group_name, group_settings in self._grouped_settings.items():
-            group_obj = getattr(self, group_name, None)
-            if isinstance(group_obj, SettingsGroup):
-                for setting_name in group_settings:
-                    if hasattr(group_obj, setting_name):
-                        value = getattr(group_obj, setting_name)
-                        self._grouped_settings[group_name][setting_name][
-                            "value"
-                        ] = value
+            # Groups that were never accessed can't have modifications
+            group_obj = self.__dict__.get(group_name)
+            if isinstance(group_obj, SettingsGroup) and group_obj._dirty:
+                for setting_name in group_obj._dirty:
+                    if setting_name in group_settings:
+                        group_settings[setting_name]["value"] = getattr(
+                            group_obj, setting_name
+                        )
+                group_obj._dirty.clear()
+                dirty_groups.add(group_name)
+        return dirty_groups
+
+    def _render_groups(self, dirty_groups: set[str]) -> bytes:
+        """Render the settings file, re-dumping only modified groups.
+
+        Groups holding mutable values (e.g., lists) are always re-dumped,
+        since those can be edited in place without marking them dirty.
+        """
+        header = _dump_yaml({"_entry_points_hash": _get_entry_points_hash()})
+        blocks = []
+        for group_name, group_settings in self._grouped_settings.items():
+            block = self._group_yaml.get(group_name)
+            if block is None or group_name in dirty_groups:
+                block = _dump_yaml({group_name: group_settings})
+                # Non-dict entries (metadata, malformed groups) aren't cached
+                if isinstance(group_settings, dict) and all(
+                    _is_immutable(setting_data.get("value"))
+                    for setting_data in group_settings.values()
+                    if isinstance(setting_data, dict)
+                ):
+                    self._group_yaml[group_name] = block
+            blocks.append(block)
+        return header + b"".join(blocks)
 
     def save(self):
         """Save current settings to persist across sessions."""
-        self._sync_groups_to_dict()
-        self._save_settings(self._grouped_settings)
+        dirty_groups = self._sync_groups_to_dict()
+        self._save_settings(
+            self._grouped_settings, self._render_groups(dirty_groups)
+        )
 
     def reset_to_default(
         self, setting_name: str | None = None, group: str | None = None
     ):
-        """Reset a setting (or all settings) to their default values."""
+        """Reset a setting (or all settings) to their default values.
+
+        Mutable defaults (e.g., lists) are copied, so later in-place edits
+        of a value never alter its default. Immutable ones are shared.
+        """
         if setting_name:
             # Reset single setting
             for group_name, group_settings in self._grouped_settings.items():
                 if setting_name in group_settings:
-                    default = group_settings[setting_name].get("default")
+                    default = _copy_tree(
+                        group_settings[setting_name].get("default")
+                    )
                     setattr(getattr(self, group_name), setting_name, default)
                     group_settings[setting_name]["value"] = default
                     self.save()
@@ -301,11 +618,11 @@ class Settings:
                     continue
                 for name, setting_data in group_settings.items():
                     if "default" in setting_data:
-                        default = setting_data["default"]
+                        default = _copy_tree(setting_data["default"])
                         setattr(getattr(self, group_name), name, default)
                         setting_data["value"] = default
             self.save()
 
     def get_dynamic_choices(self, provider_key: str) -> list:
         """Get dynamic choices from entry points."""
-        return [ep.name for ep in entry_points(group=provider_key)]
+        return list(_get_dynamic_choices(provider_key))
@@ -1,3 +1,5 @@
+from functools import partial
+
 from magicclass.widgets import GroupBoxContainer
 from magicgui.widgets import Container, PushButton, Widget, create_widget
 
@@ -9,6 +11,8 @@ class SettingsContainer(Container):
         super().__init__(labels=False)
         self.settings = get_settings()
         self._widgets = {}  # Store references to dynamically created widgets
+        # "Group.Setting" -> (group object, setting name) each widget writes to
+        self._targets = {}
         self._init_widgets()
         self._connect_events()
 
@@ -90,7 +94,9 @@ class SettingsContainer(Container):
                     group_obj, setting_name, setting_data
                 )
                 if widget:
-                    self._widgets[f"{group_name}.{setting_name}"] = widget
+                    key = f"{group_name}.{setting_name}"
+                    self._widgets[key] = widget
+                    self._targets[key] = (group_obj, setting_name)
                     group_widgets.append(widget)
 
             if group_widgets:
@@ -108,22 +114,30 @@ class SettingsContainer(Container):
 
     def _connect_events(self):
         """Connect all widget events to the update handler."""
-        for widget in self._widgets.values():
-            widget.changed.connect(self._update_settings)
+        for key, widget in self._widgets.items():
+            widget.changed.connect(partial(self._update_setting, key))
 
         self._reset_button.clicked.connect(self._reset_to_defaults)
 
+    def _update_setting(self, key: str, value):
+        """Update the one setting whose widget changed, then save."""
+        widget = self._widgets[key]
+        if hasattr(widget, "enabled") and not widget.enabled:
+            return
+        group_obj, setting_name = self._targets[key]
+        setattr(group_obj, setting_name, value)
+        self.settings.save()
+
     def _update_settings(self):
-        """Update settings when any widget value changes."""
-        for key, widget in self._widgets.items():
-            # key is now "Group.Setting"
-            group_name, setting_name = key.split(".", 1)
-            group_obj = getattr(
-                self.settings, group_name
-            )  # Assume group always exists
+        """Sync all widget values to settings and save.
 
+        Widget changes are handled one at a time by `_update_setting`; this
+        full sync is for pushing every widget's current value at once.
+        """
+        for key, widget in self._widgets.items():
             if hasattr(widget, "enabled") and not widget.enabled:
                 continue
+            group_obj, setting_name = self._targets[key]
             setattr(group_obj, setting_name, widget.value)
 
         # Save all changes to file after updating all widgets
@@ -135,6 +149,7 @@ class SettingsContainer(Container):
 
         self.clear()  # clear the widgets inside the container
         self._widgets.clear()  # clear the stored widget references
+        self._targets.clear()
 
         self._init_widgets()
         self._connect_events()
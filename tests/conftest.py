@@ -1,14 +1,53 @@
 """Pytest fixtures for ndev-settings tests."""
 
+import os
 import shutil
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture(autouse=True)
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "needs_settings: isolate the settings file, defaults and entry points",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Apply the `isolate_settings` fixture only to tests that need it.
+
+    Tests that never touch settings (e.g., the CLI tests) skip the file
+    copies and monkeypatching entirely.
+    """
+    for item in items:
+        if (
+            item.get_closest_marker("needs_settings")
+            and "isolate_settings" not in item.fixturenames
+        ):
+            item.fixturenames.insert(0, "isolate_settings")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_imports():
+    """Pay one-time libyaml and entry point metadata costs up front.
+
+    Keeps the first settings test from absorbing cold-start overhead.
+    """
+    from importlib.metadata import entry_points
+
+    import yaml
+
+    from ndev_settings._settings import _ENTRY_POINT_GROUP, _Loader
+
+    yaml.load("warm: up", Loader=_Loader)
+    entry_points(group=_ENTRY_POINT_GROUP)
+
+
+@pytest.fixture
 def isolate_settings(tmp_path, monkeypatch, test_data_dir):
-    """Isolate settings to tmp_path for each test.
+    """Isolate settings to tmp_path for tests marked `needs_settings`.
 
     This redirects both:
     1. The settings file location (where user settings are saved)
@@ -26,6 +65,7 @@ def isolate_settings(tmp_path, monkeypatch, test_data_dir):
     test_settings_file = test_settings_dir / "settings.yaml"
     monkeypatch.setattr(_settings, "_SETTINGS_DIR", test_settings_dir)
     monkeypatch.setattr(_settings, "_SETTINGS_FILE", test_settings_file)
+    monkeypatch.setattr(_settings, "_PARSE_CACHE", OrderedDict())
 
     # Mock entry_points to return empty list (isolate from external packages)
     from importlib.metadata import EntryPoints
@@ -42,25 +82,38 @@ def isolate_settings(tmp_path, monkeypatch, test_data_dir):
 
     # Redirect default settings file path
     original_settings_init = Settings.__init__
-    real_settings_path = str(
+    real_settings_path = os.fspath(
         Path(ndev_settings.__file__).parent / "ndev_settings.yaml"
     )
 
     def mock_settings_init(self, defaults_file=None):
         """Redirect default settings file to test data."""
-        if defaults_file == real_settings_path or defaults_file is None:
-            defaults_file = str(test_defaults_path)
+        if (
+            defaults_file is None
+            or os.fspath(defaults_file) == real_settings_path
+        ):
+            defaults_file = test_defaults_path
         return original_settings_init(self, defaults_file)
 
     monkeypatch.setattr(Settings, "__init__", mock_settings_init)
 
-    # Reset singleton before each test
+    # Reset singleton and cached entry point lookups before each test
+    # (captured up front, as tests may monkeypatch the cached functions)
+    entry_point_caches = (
+        _settings._discover_external_yaml_paths,
+        _settings._get_dynamic_choices,
+        _settings._get_entry_points_hash,
+    )
     ndev_settings._settings_instance = None
+    for cached in entry_point_caches:
+        cached.cache_clear()
 
     yield test_defaults_path
 
-    # Clean up singleton after test
+    # Clean up singleton and entry point caches after test
     ndev_settings._settings_instance = None
+    for cached in entry_point_caches:
+        cached.cache_clear()
 
 
 @pytest.fixture
@@ -93,74 +146,101 @@ def empty_settings_file(tmp_path):
     return tmp_path / "nonexistent.yaml"
 
 
-@pytest.fixture
-def mock_external_contributions(tmp_path, test_data_dir, monkeypatch):
-    """Mock entry points that provide external YAML contributions."""
+class MockEntryPoint:
+    """Minimal stand-in for `importlib.metadata.EntryPoint`."""
 
-    # Copy external contribution file to temp directory
-    external_file = tmp_path / "external_contribution.yaml"
-    shutil.copy(test_data_dir / "external_contribution.yaml", external_file)
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
 
-    class MockEntryPoint:
-        def __init__(self, name, package_name, resource_name, resource_path):
-            self.name = name
-            self.value = f"{package_name}:{resource_name}"
-            self._resource_path = resource_path
-            self._package_name = package_name
-            self._resource_name = resource_name
-
-    def mock_entry_points(group=None):
-        if group == "ndev_settings.manifest":
-            return [
-                MockEntryPoint(
-                    "test_external",
-                    "mock_package",
-                    "settings.yaml",
-                    external_file,
-                )
-            ]
-        return []
-
-    # Mock distribution() to return our test file path
-    class MockPackagePath:
-        def __init__(self, package_name, resource_name, actual_path):
-            self._path = actual_path
-            self.name = resource_name  # This is what file.name returns
-            self._package_name = package_name
-
-        def __str__(self):
-            # Return something like "mock_package/settings.yaml"
-            # so package_name is in str(file)
-            return f"{self._package_name}/{self.name}"
-
-    class MockDistribution:
-        def __init__(self, package_name, resource_name, resource_path):
-            self._package_name = package_name
-            self._resource_path = resource_path
-            # Create a mock files list with proper name and str representation
-            self.files = [
-                MockPackagePath(package_name, resource_name, resource_path)
-            ]
-
-        def locate_file(self, file):
-            if hasattr(file, "_path"):
-                return file._path
-            # For editable install fallback
-            return self._resource_path.parent
 
+class MockPackagePath:
+    """Stand-in for a `PackagePath` entry of `Distribution.files`."""
+
+    def __init__(self, package_name, resource_name, actual_path):
+        self._path = actual_path
+        self.name = resource_name  # This is what file.name returns
+        self._package_name = package_name
+
+    def __str__(self):
+        # Return something like "mock_package/settings.yaml"
+        # so package_name is in str(file)
+        return f"{self._package_name}/{self.name}"
+
+
+class MockDistribution:
+    """Stand-in for a `Distribution` providing a single resource file."""
+
+    def __init__(self, package_name, resource_name, resource_path):
+        self._package_name = package_name
+        self._resource_path = resource_path
+        # Create a mock files list with proper name and str representation
+        self.files = [
+            MockPackagePath(package_name, resource_name, resource_path)
+        ]
+
+    def locate_file(self, file):
+        if hasattr(file, "_path"):
+            return file._path
+        # For editable install fallback
+        return self._resource_path.parent
+
+
+@pytest.fixture
+def mock_entry_points_factory(monkeypatch):
+    """Return a function that mocks `ndev_settings.manifest` entry points.
+
+    The function takes a list of ``(name, "package:resource")`` pairs and
+    an optional mapping of package name to the file its distribution
+    should resolve the resource to.
+    """
     from importlib.metadata import distribution as orig_dist
 
-    def mock_distribution(package_name):
-        if package_name == "mock_package":
-            return MockDistribution(
-                package_name, "settings.yaml", external_file
+    from ndev_settings._settings import _ENTRY_POINT_GROUP
+
+    def _mock(entry_points, distributions=None):
+        eps = [MockEntryPoint(name, value) for name, value in entry_points]
+        resources = dict(ep.value.split(":", 1) for ep in eps)
+        distributions = distributions or {}
+
+        def mock_entry_points(group=None):
+            if group == _ENTRY_POINT_GROUP:
+                return eps
+            return []
+
+        def mock_distribution(package_name):
+            if package_name in distributions:
+                return MockDistribution(
+                    package_name,
+                    resources[package_name],
+                    distributions[package_name],
+                )
+            return orig_dist(package_name)
+
+        monkeypatch.setattr(
+            "ndev_settings._settings.entry_points", mock_entry_points
+        )
+        if distributions:
+            monkeypatch.setattr(
+                "importlib.metadata.distribution", mock_distribution
             )
-        return orig_dist(package_name)
 
-    # Apply the patches
-    monkeypatch.setattr(
-        "ndev_settings._settings.entry_points", mock_entry_points
+    return _mock
+
+
+@pytest.fixture
+def mock_external_contributions(
+    tmp_path, test_data_dir, mock_entry_points_factory
+):
+    """Mock entry points that provide external YAML contributions."""
+
+    # Copy external contribution file to temp directory
+    external_file = tmp_path / "external_contribution.yaml"
+    shutil.copy(test_data_dir / "external_contribution.yaml", external_file)
+
+    mock_entry_points_factory(
+        [("test_external", "mock_package:settings.yaml")],
+        {"mock_package": external_file},
     )
-    monkeypatch.setattr("importlib.metadata.distribution", mock_distribution)
 
     return external_file
@@ -1,10 +1,13 @@
 """Tests for ndev-settings CLI utilities."""
 
+import io
 import sys
+import tempfile
 
 import yaml
 
 from ndev_settings._cli import main_reset_values, reset_values_to_defaults
+from ndev_settings._settings import _Loader
 
 
 class TestResetValuesToDefaults:
@@ -31,7 +34,7 @@ class TestResetValuesToDefaults:
 
         assert result is True
         with open(settings_file) as f:
-            updated = yaml.load(f, Loader=yaml.FullLoader)
+            updated = yaml.load(f, Loader=_Loader)
         assert updated["TestGroup"]["setting1"]["value"] == "original"
         assert updated["TestGroup"]["setting2"]["value"] == 50
 
@@ -150,7 +153,7 @@ class TestResetValuesToDefaults:
 
         assert result is True
         with open(settings_file) as f:
-            updated = yaml.load(f, Loader=yaml.FullLoader)
+            updated = yaml.load(f, Loader=_Loader)
         # Hash should be preserved
         assert updated["_entry_points_hash"] == "abc123"
         # Settings should be reset
@@ -179,6 +182,134 @@ class TestResetValuesToDefaults:
 
         assert result is True
 
+    def test_accepts_binary_stream(self):
+        """Test that binary file-like objects are rewritten in place."""
+        settings_file = io.BytesIO(
+            yaml.dump(
+                {
+                    "TestGroup": {
+                        "setting1": {
+                            "value": "modified",
+                            "default": "original",
+                        },
+                    }
+                }
+            ).encode()
+        )
+
+        result = reset_values_to_defaults(settings_file)
+
+        assert result is True
+        settings_file.seek(0)
+        updated = yaml.load(settings_file, Loader=_Loader)
+        assert updated["TestGroup"]["setting1"]["value"] == "original"
+
+    def test_accepts_text_stream(self):
+        """Test that text file-like objects are rewritten in place."""
+        settings_file = io.StringIO(
+            yaml.dump(
+                {"TestGroup": {"s": {"value": "modified", "default": "orig"}}}
+            )
+        )
+
+        result = reset_values_to_defaults(settings_file)
+
+        assert result is True
+        settings_file.seek(0)
+        updated = yaml.load(settings_file, Loader=_Loader)
+        assert updated["TestGroup"]["s"]["value"] == "orig"
+
+    def test_accepts_text_stream_not_derived_from_textiobase(self):
+        """Test that text streams are detected by what they return."""
+        data = {"TestGroup": {"s": {"value": "modified", "default": "orig"}}}
+        with tempfile.SpooledTemporaryFile(mode="w+") as settings_file:
+            settings_file.write(yaml.dump(data))
+            settings_file.seek(0)
+
+            result = reset_values_to_defaults(settings_file)
+
+            assert result is True
+            settings_file.seek(0)
+            updated = yaml.load(settings_file.read(), Loader=_Loader)
+        assert updated["TestGroup"]["s"]["value"] == "orig"
+
+    def test_file_without_defaults_is_not_parsed(self, tmp_path, monkeypatch):
+        """Test that files without any 'default' key skip YAML parsing."""
+        from ndev_settings import _cli
+
+        settings_file = tmp_path / "settings.yaml"
+        settings_file.write_text(
+            yaml.dump({"TestGroup": {"setting1": {"value": "something"}}})
+        )
+
+        def fail_loader(*args, **kwargs):
+            raise AssertionError("the YAML loader should not be created")
+
+        monkeypatch.setattr(_cli, "_Loader", fail_loader)
+
+        assert reset_values_to_defaults(settings_file) is False
+
+    def test_reset_preserves_comments_and_formatting(self):
+        """Test that scalar values are edited in place, keeping comments."""
+        settings_file = io.StringIO(
+            "# Local settings\n"
+            "TestGroup:\n"
+            "  setting1:\n"
+            "    value: 100  # tweaked locally\n"
+            "    default: 50\n"
+        )
+
+        result = reset_values_to_defaults(settings_file)
+
+        assert result is True
+        assert settings_file.getvalue() == (
+            "# Local settings\n"
+            "TestGroup:\n"
+            "  setting1:\n"
+            "    value: 50  # tweaked locally\n"
+            "    default: 50\n"
+        )
+
+    def test_reset_multiline_values_falls_back_to_dump(self):
+        """Test that non-scalar values are reset by re-dumping the file."""
+        settings_file = io.StringIO(
+            "TestGroup:\n"
+            "  setting_tuple:\n"
+            "    value: !!python/tuple\n"
+            "    - 10\n"
+            "    - 20\n"
+            "    default: !!python/tuple\n"
+            "    - 0\n"
+            "    - 0\n"
+        )
+
+        result = reset_values_to_defaults(settings_file)
+
+        assert result is True
+        settings_file.seek(0)
+        updated = yaml.load(settings_file, Loader=_Loader)
+        assert updated["TestGroup"]["setting_tuple"]["value"] == (0, 0)
+
+    def test_reset_anchored_values_falls_back_to_dump(self):
+        """Test that values shared through YAML anchors are reset safely."""
+        settings_file = io.StringIO(
+            "TestGroup:\n"
+            "  s:\n"
+            "    value: &v 100\n"
+            "    default: 50\n"
+            "  t:\n"
+            "    value: *v\n"
+            "    default: 100\n"
+        )
+
+        result = reset_values_to_defaults(settings_file)
+
+        assert result is True
+        settings_file.seek(0)
+        updated = yaml.load(settings_file, Loader=_Loader)
+        assert updated["TestGroup"]["s"]["value"] == 50
+        assert updated["TestGroup"]["t"]["value"] == 100
+
 
 class TestMainResetValues:
     """Tests for main_reset_values CLI entry point."""
@@ -1,5 +1,9 @@
+import pytest
+
 from ndev_settings import get_settings
 
+pytestmark = pytest.mark.needs_settings
+
 
 def test_get_settings_singleton():
     """Test the singleton behavior of get_settings."""
@@ -9,3 +13,13 @@ def test_get_settings_singleton():
 
     # They should be the same object
     assert settings1 is settings2
+
+
+def test_get_settings_singleton_across_threads():
+    """Test that concurrent first calls share a single instance."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        instances = list(executor.map(lambda _: get_settings(), range(16)))
+
+    assert all(instance is instances[0] for instance in instances)
@@ -1,27 +1,64 @@
 """Tests for the Settings class."""
 
+import stat
+import sys
+
+import pytest
+import yaml
+
 from ndev_settings._settings import Settings
 
+pytestmark = pytest.mark.needs_settings
+
 
 class TestSettingsBasics:
     """Test basic Settings functionality."""
 
     def test_settings_load_from_file(self, test_settings_file):
         """Test loading settings from a YAML file."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Check groups exist
-        assert hasattr(settings, "Group_A")
-        assert hasattr(settings, "Group_B")
+        assert "Group_A" in settings
+        assert "Group_B" in settings
 
         # Check some specific settings
         assert settings.Group_A.setting_int == 49
         assert settings.Group_A.setting_choices == "another_option"
         assert settings.Group_A.setting_bool is True
 
+    def test_groups_built_on_first_access(self, test_settings_file):
+        """Test that group objects are only created when first accessed."""
+        settings = Settings(test_settings_file)
+        assert "Group_B" not in vars(settings)
+
+        group_b = settings.Group_B
+
+        assert vars(settings)["Group_B"] is group_b
+        assert settings.Group_B is group_b
+        assert not hasattr(settings, "Missing_Group")
+
+    def test_contains_does_not_build_group(self, test_settings_file):
+        """Test that `in` checks groups without creating group objects."""
+        settings = Settings(test_settings_file)
+
+        assert "Group_B" in settings
+        assert "Missing_Group" not in settings
+        assert "Group_B" not in vars(settings)
+
+    def test_contains_matches_group_access(self, test_settings_file):
+        """Test that `in` is False for entries that aren't groups."""
+        settings = Settings(test_settings_file)
+        settings._grouped_settings["_meta"] = {"some": "data"}
+        settings._grouped_settings["Malformed"] = "just_a_string"
+
+        assert "_meta" not in settings
+        assert "Malformed" not in settings
+        assert not hasattr(settings, "Malformed")
+
     def test_settings_access_values(self, test_settings_file):
         """Test accessing setting values."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Test various data types
         assert isinstance(settings.Group_A.setting_int, int)
@@ -33,7 +70,7 @@ class TestSettingsBasics:
 
     def test_settings_modify_values(self, test_settings_file):
         """Test modifying setting values."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify various settings
         settings.Group_A.setting_int = 100
@@ -51,7 +88,7 @@ class TestSettingsReset:
 
     def test_reset_single_setting(self, test_settings_file):
         """Test resetting a single setting to default."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify a setting
         settings.Group_A.setting_int = 999
@@ -65,7 +102,7 @@ class TestSettingsReset:
 
     def test_reset_all_settings(self, test_settings_file):
         """Test resetting all settings to defaults."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify several settings
         settings.Group_A.setting_int = 999
@@ -80,9 +117,20 @@ class TestSettingsReset:
         assert settings.Group_A.setting_bool is False  # default
         assert settings.Group_B.setting_int == 50  # default
 
+    def test_reset_does_not_alias_mutable_defaults(self, test_settings_file):
+        """Test that mutating a reset list value leaves its default intact."""
+        settings = Settings(test_settings_file)
+
+        settings.reset_to_default("setting_list")
+        settings.Group_A.setting_list.append(99)
+
+        assert settings._grouped_settings["Group_A"]["setting_list"][
+            "default"
+        ] == [0, 0, 0]
+
     def test_reset_by_group(self, test_settings_file):
         """Test resetting settings by group."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify settings in both groups
         settings.Group_A.setting_int = 999
@@ -101,7 +149,7 @@ class TestSettingsSaveLoad:
 
     def test_save_syncs_values(self, test_settings_file):
         """Test that save() syncs group values to internal dict."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify some settings via group objects
         settings.Group_A.setting_int = 555
@@ -126,16 +174,156 @@ class TestSettingsSaveLoad:
             == "Saved text"
         )
 
+    def test_save_only_syncs_modified_settings(self, test_settings_file):
+        """Test that only settings assigned a new object are marked dirty."""
+        settings = Settings(test_settings_file)
+        assert settings.Group_A._dirty == set()
+
+        settings.Group_A.setting_int = settings.Group_A.setting_int
+        settings.Group_A.setting_string = "Changed"
+        assert settings.Group_A._dirty == {"setting_string"}
+
+        settings.save()
+        assert settings.Group_A._dirty == set()
+        assert (
+            settings._grouped_settings["Group_A"]["setting_string"]["value"]
+            == "Changed"
+        )
+
+    def test_save_keeps_equal_but_replaced_values(self, test_settings_file):
+        """Test that equal-valued reassignments are still written back."""
+        settings1 = Settings(test_settings_file)
+        settings1.Group_A.setting_list = list(settings1.Group_A.setting_list)
+        settings1.Group_A.setting_list.append(99)
+        settings1.Group_A.setting_int = 49.0
+        settings1.save()
+
+        settings2 = Settings(test_settings_file)
+        assert settings2.Group_A.setting_list == [1, 2, 3, 99]
+        assert isinstance(settings2.Group_A.setting_int, float)
+
+    def test_unchanged_save_skips_write(self, test_settings_file, monkeypatch):
+        """Test that saving identical settings does not rewrite the file."""
+        from ndev_settings import _settings
+
+        settings = Settings(test_settings_file)
+        settings.save()
+
+        def fail_write(path, data):
+            raise AssertionError("File should not be rewritten")
+
+        monkeypatch.setattr(_settings, "_atomic_write_bytes", fail_write)
+        settings.save()
+
+    def test_save_redumps_only_modified_groups(
+        self, test_settings_file, monkeypatch
+    ):
+        """Test that save() reuses rendered YAML for unmodified groups."""
+        from ndev_settings import _settings
+
+        settings = Settings(test_settings_file)
+        settings.save()
+
+        dumped = []
+        dump_yaml = _settings._dump_yaml
+
+        def tracking_dump(data):
+            dumped.append(next(iter(data)))
+            return dump_yaml(data)
+
+        monkeypatch.setattr(_settings, "_dump_yaml", tracking_dump)
+        settings.Group_B.setting_int = 7
+        settings.save()
+
+        # Group_A holds a list, so it is always re-rendered
+        assert "Group_B" in dumped
+        assert dumped.count("Group_B") == 1
+        assert "External_Contribution" not in dumped
+        assert _settings._SETTINGS_FILE.read_bytes() == dump_yaml(
+            {
+                "_entry_points_hash": _settings._get_entry_points_hash(),
+                **settings._grouped_settings,
+            }
+        )
+
+    def test_save_with_non_dict_entries(self, tmp_path):
+        """Test that save() handles metadata and malformed top-level entries."""
+        from ndev_settings import _settings
+
+        defaults_file = tmp_path / "defaults.yaml"
+        defaults_file.write_text(
+            yaml.dump(
+                {
+                    "_meta": "hello",
+                    "Malformed": "just_a_string",
+                    "G": {"a": {"value": 1, "default": 1}},
+                }
+            )
+        )
+        settings = Settings(defaults_file)
+        settings.G.a = 2
+        settings.save()
+
+        with open(_settings._SETTINGS_FILE) as f:
+            saved = yaml.load(f, Loader=_settings._Loader)
+        assert saved["G"]["a"]["value"] == 2
+        assert saved["Malformed"] == "just_a_string"
+        assert saved["_meta"] == "hello"
+
+    def test_save_keeps_in_place_list_edits(self, test_settings_file):
+        """Test that in-place edits of list values are still saved."""
+        settings1 = Settings(test_settings_file)
+        settings1.save()
+        settings1.Group_A.setting_list.append(4)
+        settings1.save()
+
+        settings2 = Settings(test_settings_file)
+        assert settings2.Group_A.setting_list == [1, 2, 3, 4]
+
+    def test_save_writes_atomically(self, test_settings_file, monkeypatch):
+        """Test that a failed save leaves the previous settings file intact."""
+        from ndev_settings import _settings
+
+        settings = Settings(test_settings_file)
+        settings.save()
+        before = _settings._SETTINGS_FILE.read_bytes()
+
+        def failing_replace(src, dst):
+            raise OSError("Simulated crash before replace")
+
+        monkeypatch.setattr(_settings.os, "replace", failing_replace)
+        settings.Group_A.setting_int = 123
+        settings.save()
+
+        assert _settings._SETTINGS_FILE.read_bytes() == before
+        assert not list(_settings._SETTINGS_DIR.glob("*.tmp"))
+
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="POSIX permission bits"
+    )
+    def test_save_keeps_file_permissions(self, test_settings_file):
+        """Test that saving keeps the settings file's permission bits."""
+        from ndev_settings import _settings
+
+        settings = Settings(test_settings_file)
+        settings.save()
+        _settings._SETTINGS_FILE.chmod(0o644)
+
+        settings.Group_A.setting_int = 123
+        settings.save()
+
+        assert stat.S_IMODE(_settings._SETTINGS_FILE.stat().st_mode) == 0o644
+
     def test_save_persists_across_instances(self, test_settings_file):
         """Test that saved settings are loaded by new instances."""
-        settings1 = Settings(str(test_settings_file))
+        settings1 = Settings(test_settings_file)
 
         # Modify and save
         settings1.Group_A.setting_int = 999
         settings1.save()
 
         # Create new instance - should load saved value
-        settings2 = Settings(str(test_settings_file))
+        settings2 = Settings(test_settings_file)
         assert settings2.Group_A.setting_int == 999
 
     def test_cached_load_uses_saved_file(
@@ -156,7 +344,7 @@ class TestSettingsSaveLoad:
         monkeypatch.setattr(Settings, "_load_defaults", tracking_load_defaults)
 
         # First load - should discover from files (calls _load_defaults)
-        settings1 = Settings(str(test_settings_file))
+        settings1 = Settings(test_settings_file)
         first_load_calls = load_defaults_call_count
 
         # Verify the cache file was created
@@ -165,7 +353,7 @@ class TestSettingsSaveLoad:
         ), "Cache file should exist after first load"
 
         # Second load - should use cached file, not call _load_defaults again
-        settings2 = Settings(str(test_settings_file))
+        settings2 = Settings(test_settings_file)
 
         # Both should have same values
         assert settings1.Group_A.setting_int == settings2.Group_A.setting_int
@@ -184,7 +372,7 @@ class TestCachingBehavior:
         """Test that clear_settings() forces re-discovery from defaults."""
         from ndev_settings import _settings
 
-        settings1 = Settings(str(test_settings_file))
+        settings1 = Settings(test_settings_file)
         settings1.Group_A.setting_int = 888
         settings1.save()
 
@@ -192,7 +380,7 @@ class TestCachingBehavior:
         _settings.clear_settings()
 
         # New instance should have default values
-        settings2 = Settings(str(test_settings_file))
+        settings2 = Settings(test_settings_file)
         assert (
             settings2.Group_A.setting_int == 49
         )  # default from test_settings.yaml
@@ -204,7 +392,7 @@ class TestCachingBehavior:
         from ndev_settings import _settings
 
         # First load and save custom values
-        settings1 = Settings(str(test_settings_file))
+        settings1 = Settings(test_settings_file)
         settings1.Group_A.setting_int = 777
         settings1.save()
 
@@ -215,11 +403,161 @@ class TestCachingBehavior:
         )
 
         # New instance should merge: new defaults + saved user values
-        settings2 = Settings(str(test_settings_file))
+        settings2 = Settings(test_settings_file)
 
         # User's custom value should be preserved
         assert settings2.Group_A.setting_int == 777
 
+    def test_unchanged_yaml_is_parsed_once(self, test_settings_file):
+        """Test that repeated loads of an unchanged file hit the parse cache."""
+        from ndev_settings import _settings
+
+        first = _settings._load_yaml(test_settings_file)
+        assert len(_settings._PARSE_CACHE) == 1
+
+        # Mutating the returned dict must not leak into the cache
+        first["Group_A"]["setting_int"]["value"] = -1
+        second = _settings._load_yaml(test_settings_file)
+        assert second["Group_A"]["setting_int"]["value"] == 49
+
+    def test_parse_cache_keyed_by_absolute_path(
+        self, test_settings_file, monkeypatch
+    ):
+        """Test that relative and absolute paths share one cache entry."""
+        from ndev_settings import _settings
+
+        monkeypatch.chdir(test_settings_file.parent)
+        _settings._load_yaml(test_settings_file)
+        _settings._load_yaml(test_settings_file.name)
+
+        assert len(_settings._PARSE_CACHE) == 1
+
+    def test_parse_cache_concurrent_loads(
+        self, test_settings_file, monkeypatch
+    ):
+        """Test that concurrent loads with evictions keep the cache intact."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ndev_settings import _settings
+
+        monkeypatch.setattr(_settings, "_PARSE_CACHE_MAXSIZE", 1)
+        paths = [test_settings_file]
+        for i in range(3):
+            path = test_settings_file.with_name(f"copy_{i}.yaml")
+            path.write_bytes(test_settings_file.read_bytes())
+            paths.append(path)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_settings._load_yaml, paths * 25))
+
+        assert all(
+            result["Group_A"]["setting_int"]["value"] == 49
+            for result in results
+        )
+        assert len(_settings._PARSE_CACHE) == 1
+
+    def test_clear_settings_clears_parse_cache(self, test_settings_file):
+        """Test that clear_settings() drops all cached parses."""
+        from ndev_settings import _settings
+
+        _settings._load_yaml(test_settings_file)
+        _settings.clear_settings()
+
+        assert len(_settings._PARSE_CACHE) == 0
+
+    def test_clear_settings_clears_entry_point_caches(self):
+        """Test that clear_settings() drops memoized entry point lookups."""
+        from ndev_settings import _settings
+
+        _settings._discover_external_yaml_paths(())
+        _settings.clear_settings()
+
+        assert (
+            _settings._discover_external_yaml_paths.cache_info().currsize == 0
+        )
+
+    def test_parse_cache_invalidated_on_save(self, test_settings_file):
+        """Test that saving drops the cached parse of the settings file."""
+        settings1 = Settings(test_settings_file)
+        settings1.Group_A.setting_int = 50  # same size as the original 49
+        settings1.save()
+
+        settings2 = Settings(test_settings_file)
+        assert settings2.Group_A.setting_int == 50
+
+    def test_sidecar_used_when_hash_matches(
+        self, test_settings_file, monkeypatch
+    ):
+        """Test that the marshal sidecar is read instead of re-parsing YAML."""
+        from ndev_settings import _settings
+
+        settings1 = Settings(test_settings_file)
+        settings1.Group_A.setting_int = 123
+        settings1.save()
+        assert _settings._sidecar_path().exists()
+
+        def fail_load_yaml(path):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(_settings, "_load_yaml", fail_load_yaml)
+        settings2 = Settings(test_settings_file)
+
+        assert settings2.Group_A.setting_int == 123
+        assert isinstance(settings2.Group_A.setting_tuple, tuple)
+
+    def test_sidecar_skipped_for_unmarshallable_values(
+        self, test_settings_file
+    ):
+        """Test that values marshal can't store fall back to YAML."""
+        import datetime
+
+        from ndev_settings import _settings
+
+        settings = Settings(test_settings_file)
+        settings.save()
+        assert _settings._sidecar_path().exists()
+
+        settings.Group_A.setting_string = datetime.date(2024, 1, 2)
+        settings.save()
+
+        assert not _settings._sidecar_path().exists()
+        data = _settings._load_settings_file()
+        assert data["Group_A"]["setting_string"]["value"] == datetime.date(
+            2024, 1, 2
+        )
+
+    def test_sidecar_ignored_when_yaml_edited(self, test_settings_file):
+        """Test that a stale sidecar is ignored after the YAML is edited."""
+        from ndev_settings import _settings
+
+        Settings(test_settings_file).save()
+        text = _settings._SETTINGS_FILE.read_text()
+        _settings._SETTINGS_FILE.write_text(
+            text.replace("value: 49", "value: 77")
+        )
+
+        settings = Settings(test_settings_file)
+        assert settings.Group_A.setting_int == 77
+
+    def test_entry_points_hash_memoized(self, monkeypatch):
+        """Test that the entry points hash is computed once per session."""
+        from ndev_settings import _settings
+
+        calls = []
+
+        def counting_entry_points(group=None):
+            calls.append(group)
+            return []
+
+        monkeypatch.setattr(_settings, "entry_points", counting_entry_points)
+        first = _settings._get_entry_points_hash()
+        assert _settings._get_entry_points_hash() == first
+        assert len(calls) == 1
+
+        _settings.clear_settings()
+        _settings._get_entry_points_hash()
+        assert len(calls) == 2
+
     def test_clear_settings_handles_missing_file(self):
         """Test that clear_settings doesn't crash if file doesn't exist."""
         from ndev_settings import _settings
@@ -233,7 +571,7 @@ class TestDynamicChoices:
 
     def test_dynamic_choices_handling(self, test_settings_file):
         """Test that dynamic choices settings work correctly."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Test the dynamic choices method
         choices = settings.get_dynamic_choices("bioio.readers")
@@ -245,6 +583,31 @@ class TestDynamicChoices:
         empty_choices = settings.get_dynamic_choices("invalid.provider")
         assert empty_choices == []
 
+    def test_dynamic_choices_cached_per_provider(
+        self, test_settings_file, monkeypatch
+    ):
+        """Test that entry points are only enumerated once per provider."""
+        from ndev_settings import _settings
+
+        calls = []
+
+        def counting_entry_points(group=None):
+            calls.append(group)
+            return []
+
+        monkeypatch.setattr(_settings, "entry_points", counting_entry_points)
+        settings = Settings(test_settings_file)
+        calls.clear()
+
+        settings.get_dynamic_choices("bioio.readers")
+        settings.get_dynamic_choices("bioio.readers")
+
+        assert calls == ["bioio.readers"]
+
+        _settings.clear_settings()
+        settings.get_dynamic_choices("bioio.readers")
+        assert calls == ["bioio.readers", "bioio.readers"]
+
 
 class TestExternalContributions:
     """Test external library contributions via entry points."""
@@ -253,14 +616,14 @@ class TestExternalContributions:
         self, test_settings_file, mock_external_contributions
     ):
         """Test that external YAML files are loaded and merged."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Should have main settings
-        assert hasattr(settings, "Group_A")
-        assert hasattr(settings, "Group_B")
+        assert "Group_A" in settings
+        assert "Group_B" in settings
 
         # Should also have external contributions
-        assert hasattr(settings, "External_Contribution")
+        assert "External_Contribution" in settings
 
         # Check external settings values
         assert settings.External_Contribution.setting_int == 10
@@ -270,7 +633,7 @@ class TestExternalContributions:
         self, test_settings_file, mock_external_contributions
     ):
         """Test that main settings take precedence over external ones."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Group_A exists in both main and external files
         # Main file should take precedence
@@ -282,14 +645,14 @@ class TestExternalContributions:
         )  # from main file
 
         # But external-only settings should still be loaded
-        assert hasattr(settings, "External_Contribution")
+        assert "External_Contribution" in settings
         assert settings.External_Contribution.setting_int == 10
 
     def test_external_adds_new_setting_to_existing_group(
         self, test_settings_file, mock_external_contributions
     ):
         """Test that external contributions can add new settings to existing groups."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Group_A exists in main file, but external file adds a new setting to it
         assert hasattr(settings.Group_A, "external_only_setting")
@@ -299,7 +662,7 @@ class TestExternalContributions:
         self, test_settings_file, mock_external_contributions
     ):
         """Test that external settings can be modified via group objects."""
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Modify external setting via group object
         settings.External_Contribution.setting_int = 999
@@ -315,8 +678,58 @@ class TestExternalContributions:
             == 999
         )
 
+    def test_external_yaml_paths_cached(
+        self, test_settings_file, mock_external_contributions, monkeypatch
+    ):
+        """Test that external YAML paths are resolved once per entry points."""
+        import importlib.metadata
+
+        from ndev_settings import _settings
+
+        Settings(test_settings_file)
+        # Drop the saved file (but not the path cache) to force re-discovery
+        _settings._SETTINGS_FILE.unlink()
+        _settings._sidecar_path().unlink(missing_ok=True)
+
+        def fail_distribution(package_name):
+            raise AssertionError("distribution() should not be called")
+
+        monkeypatch.setattr(
+            importlib.metadata, "distribution", fail_distribution
+        )
+        settings = Settings(test_settings_file)
+
+        assert settings.External_Contribution.setting_int == 10
+
+    def test_repeated_external_entry_points_deduplicated(
+        self, external_contribution_file, mock_entry_points_factory
+    ):
+        """Test that entry points naming the same resource resolve once."""
+        from ndev_settings import _settings
+
+        mock_entry_points_factory(
+            [
+                ("first", "mock_package:settings.yaml"),
+                ("second", "mock_package:settings.yaml"),
+            ],
+            {"mock_package": external_contribution_file},
+        )
+        eps = tuple(
+            (ep.name, ep.value)
+            for ep in _settings.entry_points(
+                group=_settings._ENTRY_POINT_GROUP
+            )
+        )
+
+        paths = _settings._discover_external_yaml_paths(eps)
+
+        assert paths == (external_contribution_file,)
+
     def test_duplicate_external_contributions_handling(
-        self, test_settings_file, tmp_path, monkeypatch
+        self,
+        test_settings_file,
+        tmp_path,
+        mock_entry_points_factory,
     ):
         """Test what happens when multiple external libraries contribute the same settings."""
 
@@ -347,8 +760,6 @@ class TestExternalContributions:
         }
 
         # Write external files
-        import yaml
-
         external1_file = tmp_path / "external1.yaml"
         external2_file = tmp_path / "external2.yaml"
 
@@ -360,81 +771,19 @@ class TestExternalContributions:
         )
 
         # Mock multiple entry points
-        class MockEntryPoint:
-            def __init__(
-                self, name, package_name, resource_name, resource_path
-            ):
-                self.name = name
-                self.value = f"{package_name}:{resource_name}"
-                self._resource_path = resource_path
-
-        def mock_entry_points(group=None):
-            if group == "ndev_settings.manifest":
-                return [
-                    MockEntryPoint(
-                        "external1",
-                        "mock_package1",
-                        "settings.yaml",
-                        external1_file,
-                    ),
-                    MockEntryPoint(
-                        "external2",
-                        "mock_package2",
-                        "settings.yaml",
-                        external2_file,
-                    ),
-                ]
-            return []
-
-        # Mock distribution() to return our test files
-        class MockPackagePath:
-            def __init__(self, package_name, resource_name, actual_path):
-                self._path = actual_path
-                self.name = resource_name
-                self._package_name = package_name
-
-            def __str__(self):
-                return f"{self._package_name}/{self.name}"
-
-        class MockDistribution:
-            def __init__(self, package_name, resource_name, resource_path):
-                self._package_name = package_name
-                self._resource_path = resource_path
-                self.files = [
-                    MockPackagePath(package_name, resource_name, resource_path)
-                ]
-
-            def locate_file(self, file):
-                if hasattr(file, "_path"):
-                    return file._path
-                return self._resource_path.parent
-
-        from importlib.metadata import distribution as orig_dist
-
-        def mock_distribution(package_name):
-            if package_name == "mock_package1":
-                return MockDistribution(
-                    package_name, "settings.yaml", external1_file
-                )
-            elif package_name == "mock_package2":
-                return MockDistribution(
-                    package_name, "settings.yaml", external2_file
-                )
-            return orig_dist(package_name)
-
-        # Apply patches
-        monkeypatch.setattr(
-            "ndev_settings._settings.entry_points", mock_entry_points
-        )
-        monkeypatch.setattr(
-            "importlib.metadata.distribution", mock_distribution
+        mock_entry_points_factory(
+            [
+                ("external1", "mock_package1:settings.yaml"),
+                ("external2", "mock_package2:settings.yaml"),
+            ],
+            {"mock_package1": external1_file, "mock_package2": external2_file},
         )
 
         # Load settings
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Should have the shared group
-        assert hasattr(settings, "Shared_Group")
+        assert "Shared_Group" in settings
 
         # First external contribution wins for overlapping settings (stable, predictable)
         # This prevents unpredictable behavior based on package load order
@@ -447,60 +796,39 @@ class TestExternalContributions:
 class TestErrorHandling:
     """Test error handling for various edge cases."""
 
-    def test_missing_file_handling(self, empty_settings_file, monkeypatch):
+    def test_missing_file_handling(
+        self, empty_settings_file, mock_entry_points_factory
+    ):
         """Test that missing files are handled gracefully."""
-
         # Mock entry points to return empty list (no external contributions)
-        def mock_entry_points(group=None):
-            return []
+        mock_entry_points_factory([])
 
-        monkeypatch.setattr(
-            "ndev_settings._settings.entry_points", mock_entry_points
-        )
-
-        settings = Settings(str(empty_settings_file))
+        settings = Settings(empty_settings_file)
 
         # Should create empty settings without crashing
         assert hasattr(settings, "_grouped_settings")
         assert settings._grouped_settings == {}
 
     def test_broken_external_entry_point(
-        self, test_settings_file, monkeypatch
+        self, test_settings_file, mock_entry_points_factory
     ):
         """Test that broken external entry points don't crash the system."""
-
-        class MockEntryPoint:
-            def __init__(self, name, value):
-                self.name = name
-                self.value = value  # This will cause import error
-
-        def mock_entry_points(group=None):
-            if group == "ndev_settings.manifest":
-                # Create an entry point with a non-existent package
-                return [
-                    MockEntryPoint(
-                        "broken", "nonexistent_package:settings.yaml"
-                    )
-                ]
-            return []
-
-        monkeypatch.setattr(
-            "ndev_settings._settings.entry_points", mock_entry_points
+        # Create an entry point with a non-existent package
+        mock_entry_points_factory(
+            [("broken", "nonexistent_package:settings.yaml")]
         )
 
         # Should not crash
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Should still have main settings
-        assert hasattr(settings, "Group_A")
+        assert "Group_A" in settings
         assert settings.Group_A.setting_int == 49
 
 
 def test_dynamic_choices(empty_settings_file):
     """Test that dynamic choices method exists and doesn't crash."""
-    settings = Settings(
-        str(empty_settings_file)
-    )  # Create without calling __init__
+    settings = Settings(empty_settings_file)  # Create without calling __init__
 
     # Test the method exists and handles missing entry points gracefully
     choices = settings.get_dynamic_choices("nonexistent.entry.point")
@@ -511,24 +839,15 @@ def test_dynamic_choices(empty_settings_file):
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_build_groups_skips_metadata_keys(self, test_settings_file):
-        """Test that _build_groups skips underscore-prefixed keys."""
-        settings = Settings(str(test_settings_file))
-
-        # Manually call _build_groups with settings containing metadata
-        settings_with_metadata = {
-            "_entry_points_hash": "abc123",
-            "_other_metadata": {"some": "data"},
-            "ValidGroup": {"setting1": {"value": 10, "default": 10}},
+    def test_metadata_keys_not_exposed_as_groups(self, test_settings_file):
+        """Test that underscore-prefixed keys are not built as groups."""
+        settings = Settings(test_settings_file)
+        settings._grouped_settings["_meta"] = {
+            "setting1": {"value": 10, "default": 10}
         }
 
-        # Clear existing groups and rebuild
-        settings._build_groups(settings_with_metadata)
-
-        # Should have ValidGroup but not metadata keys as attributes
-        assert hasattr(settings, "ValidGroup")
-        assert not hasattr(settings, "_entry_points_hash")
-        assert not hasattr(settings, "_other_metadata")
+        assert not hasattr(settings, "_meta")
+        assert "_meta" not in vars(settings)
 
     def test_save_failure_logs_warning(
         self, test_settings_file, monkeypatch, caplog
@@ -536,7 +855,7 @@ class TestEdgeCases:
         """Test that save failures are logged as warnings."""
         import logging
 
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Mock yaml.dump to raise when trying to save
         def failing_dump(*args, **kwargs):
@@ -551,7 +870,11 @@ class TestEdgeCases:
         assert "Failed to save settings" in caplog.text
 
     def test_editable_install_detection(
-        self, test_settings_file, tmp_path, monkeypatch
+        self,
+        test_settings_file,
+        tmp_path,
+        monkeypatch,
+        mock_entry_points_factory,
     ):
         """Test that editable installs are detected via direct_url.json."""
         import json
@@ -581,11 +904,6 @@ class TestEdgeCases:
             )
         )
 
-        class MockEntryPoint:
-            def __init__(self):
-                self.name = "mock_editable"
-                self.value = "mock_package:settings.yaml"
-
         class MockFile:
             """Mock file object that mimics PackagePath behavior."""
 
@@ -614,11 +932,6 @@ class TestEdgeCases:
                     return direct_url_file
                 return tmp_path / "nonexistent"  # Force fallback for others
 
-        def mock_entry_points(group=None):
-            if group == "ndev_settings.manifest":
-                return [MockEntryPoint()]
-            return []
-
         def mock_distribution(name):
             if name == "mock_package":
                 return MockDistribution()
@@ -626,7 +939,9 @@ class TestEdgeCases:
 
             return distribution(name)
 
-        monkeypatch.setattr(_settings, "entry_points", mock_entry_points)
+        mock_entry_points_factory(
+            [("mock_editable", "mock_package:settings.yaml")]
+        )
         monkeypatch.setattr(
             "importlib.metadata.distribution", mock_distribution
         )
@@ -634,10 +949,21 @@ class TestEdgeCases:
         # Clear any cached settings to force fresh load
         _settings.clear_settings()
 
-        settings = Settings(str(test_settings_file))
+        settings = Settings(test_settings_file)
 
         # Should have loaded the editable package's settings
-        assert hasattr(
-            settings, "Editable_Group"
-        ), f"Missing Editable_Group. Attrs: {[a for a in dir(settings) if not a.startswith('_')]}"
+        assert (
+            "Editable_Group" in settings
+        ), f"Missing Editable_Group. Groups: {list(settings._grouped_settings)}"
         assert settings.Editable_Group.setting1 == 42
+
+
+@pytest.mark.skipif(
+    not yaml.__with_libyaml__, reason="PyYAML built without libyaml"
+)
+def test_libyaml_backend_in_use():
+    """Test that the libyaml C loader/dumper are used for settings I/O."""
+    from ndev_settings import _settings
+
+    assert _settings._Loader is yaml.CFullLoader
+    assert _settings._Dumper is yaml.CDumper
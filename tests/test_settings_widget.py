@@ -3,6 +3,8 @@ import pytest
 from ndev_settings import get_settings
 from ndev_settings._settings_widget import SettingsContainer
 
+pytestmark = pytest.mark.needs_settings
+
 
 def test_settings_container_initialization():
     """Test that the settings container initializes with all default widgets."""
@@ -21,8 +23,8 @@ def test_settings_container_initialization():
     ]
     for widget_key in expected_widgets:
         group_name, setting_name = widget_key.split(".", 1)
-        if hasattr(settings_singleton, group_name) and hasattr(
-            getattr(settings_singleton, group_name), setting_name
+        if setting_name in settings_singleton._grouped_settings.get(
+            group_name, {}
         ):
             assert widget_key in container._widgets
 
@@ -34,7 +36,7 @@ def test_widget_types_created_correctly():
 
     # Test boolean settings create checkboxes
     if (
-        hasattr(settings, "Group_A")
+        "Group_A" in settings
         and hasattr(settings.Group_A, "setting_bool")
         and isinstance(settings.Group_A.setting_bool, bool)
         and "Group_A.setting_bool" in container._widgets
@@ -44,7 +46,7 @@ def test_widget_types_created_correctly():
 
     # Test that numeric settings create spinboxes
     if (
-        hasattr(settings, "Group_A")
+        "Group_A" in settings
         and hasattr(settings.Group_A, "setting_float")
         and "Group_A.setting_float" in container._widgets
     ):
@@ -111,6 +113,34 @@ def test_widget_updates_settings():
         container._update_settings()
 
 
+def test_widget_change_updates_only_its_setting():
+    """Test that a widget change doesn't write back other widgets' values."""
+    container = SettingsContainer()
+    float_widget = container._widgets["Group_A.setting_float"]
+    int_widget = container._widgets["Group_A.setting_int"]
+    original_float = container.settings.Group_A.setting_float
+    original_int = container.settings.Group_A.setting_int
+
+    # Change another widget without emitting, so only a full sync would
+    # pick its value up
+    with int_widget.changed.blocked():
+        int_widget.value = original_int + 1
+    float_widget.value = original_float + 1.0
+
+    assert container.settings.Group_A.setting_float == pytest.approx(
+        original_float + 1.0
+    )
+    assert container.settings.Group_A.setting_int == original_int
+    assert (
+        container.settings._grouped_settings["Group_A"]["setting_int"]["value"]
+        == original_int
+    )
+
+    with int_widget.changed.blocked():
+        int_widget.value = original_int
+    float_widget.value = original_float
+
+
 def test_settings_manual_save():
     """Test that settings can be manually saved after widget changes."""
     container = SettingsContainer()
@@ -151,10 +181,10 @@ def test_grouping_functionality():
     ]
 
     # Should have widgets from multiple groups
-    if hasattr(container.settings, "Canvas"):
+    if "Canvas" in container.settings:
         assert len(canvas_widgets) > 0, "Should have Canvas widgets"
 
-    if hasattr(container.settings, "ndevio_reader"):
+    if "ndevio_reader" in container.settings:
         assert len(reader_widgets) > 0, "Should have ndevio_reader widgets"
 
 
@@ -163,10 +193,10 @@ def test_widget_container_with_custom_settings(test_settings_file):
     # Create a Settings instance with the custom file
     from ndev_settings._settings import Settings
 
-    custom_settings = Settings(str(test_settings_file))
+    custom_settings = Settings(test_settings_file)
 
     # Verify the settings were loaded correctly
-    assert hasattr(custom_settings, "Group_A")
+    assert "Group_A" in custom_settings._grouped_settings
     assert custom_settings.Group_A.setting_int == 49
     assert custom_settings.Group_A.setting_float == 3.14
     assert custom_settings.Group_A.setting_bool is True